@@ -23,6 +23,7 @@ class EvolverConfig(BaseModel):
     model_args: list | None = Field(default=None, description="Positional arguments for model constructor.")
     model_kwargs: dict | None = Field(default=None, description="Keyword arguments for model constructor.")
     eval_config: dict[str, Any] | None = Field(default=None, description="Configuration dictionary for the evaluation script.")
+    population_dtype: str | None = Field(default="float32", description="Host storage/transfer dtype for population weights (float32 or float16). float16 is ignored (float32 used) when evolvable_hyperparams are set.")
 
     # Allow extra fields if needed, but defining them is better
     model_config = {
@@ -7,25 +7,293 @@ import numpy as np
 import os
 import importlib.util
 import time
-import random
 import logging
+import functools
+import bisect
+import weakref
+from collections import OrderedDict
+from types import ModuleType
 from typing import List, Dict, Any, Tuple # Added typing
 
+try: # Optional: fused JIT kernels for the batched GA operators; numpy paths are used without it
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Persistent pinned host staging buffers for host->GPU weight transfers, keyed on (numel, host dtype).
+# Each entry holds (buffer, event); the event marks when the last async copy out of the buffer finished.
+# LRU-bounded so buffers sized for earlier tasks' models are released instead of staying page-locked.
+_PINNED_CACHE: "OrderedDict[Tuple[int, torch.dtype], Tuple[torch.Tensor, Any]]" = OrderedDict()
+_PINNED_CACHE_MAX_ENTRIES = 2
+
+# Host dtypes weight vectors may be stored/transferred in. float16 halves host RAM and H2D bytes;
+# it is up-cast to float32 on the device. numpy has no bfloat16, so it is not offered for host storage.
+# float16 is for weight-only runs: hyperparameters stored in the same rows would lose their mutation noise.
+POPULATION_DTYPES: Dict[str, np.dtype] = {'float32': np.dtype(np.float32), 'float16': np.dtype(np.float16)}
+
+# Numpy arrays page-locked in place via cudaHostRegister, keyed on data pointer.
+# The array reference is kept so its memory cannot be freed while registered.
+_REGISTERED_HOST_ARRAYS: Dict[int, np.ndarray] = {}
+# Sorted base addresses of _REGISTERED_HOST_ARRAYS (registered ranges never overlap), for O(log n) lookups.
+_REGISTERED_HOST_STARTS: List[int] = []
+# Smaller arrays are cheaper to stage through _PINNED_CACHE. Data pointers are not page-aligned and even large
+# arrays may sit on the heap, so neighbouring arrays can share a page; registering the second one then fails
+# (already registered) and that array falls back to staging through _PINNED_CACHE.
+_MIN_INPLACE_PIN_BYTES = 1 << 20
+
+# Per-model (param data pointers, copy_plan, total_numel) for trainable parameters. copy_plan is
+# (flat destination views, split sizes = offset table, [(index, shape)] for params that cannot be viewed flat).
+# The views pin the storage they were taken from; .to()/.half()/.cuda() swap param.data for new storage, so the
+# data pointers are re-checked on every lookup and the plan rebuilt when they change.
+# Weak keys: an entry disappears together with its model.
+_PARAM_SPEC_CACHE: "weakref.WeakKeyDictionary[nn.Module, Tuple[Tuple[int, ...], Tuple[List[torch.Tensor], List[int], List[Tuple[int, torch.Size]]], int]]" = weakref.WeakKeyDictionary()
+
+# Executed model definition modules keyed on (normalized path, mtime_ns); re-executed only if the file changes.
+# LRU-bounded: uploaded definitions get a fresh path per task, so entries for finished tasks must age out.
+_MODULE_CACHE: "OrderedDict[Tuple[str, int], ModuleType]" = OrderedDict()
+_MODULE_CACHE_MAX_ENTRIES = 2
+
+# Single Generator shared by all GA operators (replaces the global `random` / legacy `np.random` states).
+# Reserved for GA randomness: nothing else draws from it, so loading scripts etc. never shifts the GA stream.
+_rng = np.random.default_rng()
+
+def get_rng() -> np.random.Generator:
+    """ Returns the module-level Generator used by the GA operators. """
+    return _rng
+
+def _reseed_rng_after_fork():
+    """ Fresh entropy in each forked worker (like stdlib `random`), so prefork workers don't share one stream. """
+    global _rng
+    _rng = np.random.default_rng()
+
+if hasattr(os, 'register_at_fork'): # POSIX only
+    os.register_at_fork(after_in_child=_reseed_rng_after_fork)
+
 # --- Utility Functions (Model Loading, Weight Handling, Evaluation) ---
 
+def _load_model_module(model_definition_path: str) -> ModuleType:
+    """ Returns the executed module for a model definition file, using _MODULE_CACHE to skip re-parsing/exec. """
+    norm_model_path = os.path.normpath(model_definition_path)
+    cache_key = (norm_model_path, os.stat(norm_model_path).st_mtime_ns)
+    model_module = _MODULE_CACHE.get(cache_key)
+    if model_module is not None:
+        _MODULE_CACHE.move_to_end(cache_key)
+        return model_module
+
+    # Stable name per path (no random suffix churn)
+    module_name = f"model_module_{abs(hash(norm_model_path)):x}_{os.path.basename(norm_model_path).split('.')[0]}"
+    spec = importlib.util.spec_from_file_location(module_name, norm_model_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load spec for module at {norm_model_path}")
+
+    model_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(model_module)
+
+    # Drop entries for older versions of the same file before caching the new one
+    for stale_key in [k for k in _MODULE_CACHE if k[0] == norm_model_path]:
+        del _MODULE_CACHE[stale_key]
+    _MODULE_CACHE[cache_key] = model_module
+    while len(_MODULE_CACHE) > _MODULE_CACHE_MAX_ENTRIES:
+        _MODULE_CACHE.popitem(last=False) # Least recently used (typically a finished task's deleted file)
+    return model_module
+
+def _get_param_copy_plan(model: nn.Module) -> Tuple[Tuple[List[torch.Tensor], List[int], List[Tuple[int, torch.Size]]], int]:
+    """
+    Returns the (copy_plan, total_numel) for model's trainable parameters, cached per model.
+    The flat destinations are views of the live parameter storage: the plan is rebuilt whenever a parameter's
+    data has been replaced since it was cached (dtype/device conversions, reassigned submodules).
+    """
+    live_params = [param for param in model.parameters() if param.requires_grad]
+    data_ptrs = tuple(param.data_ptr() for param in live_params)
+    cached = _PARAM_SPEC_CACHE.get(model)
+    if cached is not None and cached[0] == data_ptrs:
+        return cached[1], cached[2]
+
+    param_dsts, split_sizes, reshape_specs = [], [], []
+    for param in live_params:
+        if param.is_contiguous():
+            param_dsts.append(param.data.view(-1)) # Same storage: a copy into it updates the parameter
+        else:
+            reshape_specs.append((len(param_dsts), param.shape))
+            param_dsts.append(param.data)
+        split_sizes.append(param.numel())
+    copy_plan = (param_dsts, split_sizes, reshape_specs)
+    _PARAM_SPEC_CACHE[model] = (data_ptrs, copy_plan, sum(split_sizes))
+    return copy_plan, sum(split_sizes)
+
+def _copy_flat_into_params(copy_plan: Tuple[List[torch.Tensor], List[int], List[Tuple[int, torch.Size]]], flat_tensor: torch.Tensor):
+    """ Copies an on-device flat vector into the parameters: one split by the offset table, one multi-tensor copy. """
+    param_dsts, split_sizes, reshape_specs = copy_plan
+    if not param_dsts: return
+    param_slices = torch.split(flat_tensor, split_sizes)
+    if reshape_specs: # Rare non-contiguous params take a shaped view of their slice
+        param_slices = list(param_slices)
+        for idx, shape in reshape_specs:
+            param_slices[idx] = param_slices[idx].view(shape)
+    with torch.no_grad():
+        torch._foreach_copy_(param_dsts, param_slices)
+
+def pin_numpy_inplace(arr: np.ndarray) -> bool:
+    """
+    Page-locks a C-contiguous numpy array in place (cudaHostRegister), avoiding a copy into a pinned buffer.
+    Returns True if the array's memory is pinned. Caller must keep the array alive until unpin_numpy().
+    """
+    if not torch.cuda.is_available() or not isinstance(arr, np.ndarray): return False
+    if not arr.flags['C_CONTIGUOUS'] or arr.nbytes < _MIN_INPLACE_PIN_BYTES: return False
+    if _is_registered_host_array(arr): return True
+
+    cudart = torch.cuda.cudart()
+    ptr = arr.ctypes.data
+    err = cudart.cudaHostRegister(ptr, arr.nbytes, 0)
+    if err != cudart.cudaError.success:
+        logger.debug(f"cudaHostRegister failed for array at {ptr:#x} ({arr.nbytes} bytes): {cudart.cudaGetErrorString(err)}")
+        return False
+    _REGISTERED_HOST_ARRAYS[ptr] = arr
+    bisect.insort(_REGISTERED_HOST_STARTS, ptr)
+    return True
+
+def unpin_numpy(arr: np.ndarray):
+    """ Unregisters an array previously pinned with pin_numpy_inplace(). Waits for in-flight copies first. """
+    ptr = arr.ctypes.data
+    if ptr not in _REGISTERED_HOST_ARRAYS: return
+    torch.cuda.synchronize() # Async copies may still be reading from this memory
+    torch.cuda.cudart().cudaHostUnregister(ptr)
+    del _REGISTERED_HOST_ARRAYS[ptr]
+    del _REGISTERED_HOST_STARTS[bisect.bisect_left(_REGISTERED_HOST_STARTS, ptr)]
+
+def _is_registered_host_array(arr: np.ndarray) -> bool:
+    """ True if arr's memory lies entirely inside an array registered with pin_numpy_inplace(). """
+    if not _REGISTERED_HOST_ARRAYS: return False
+    start = arr.ctypes.data
+    pos = bisect.bisect_right(_REGISTERED_HOST_STARTS, start) - 1 # Last registered range starting at or before arr
+    if pos < 0: return False
+    reg_ptr = _REGISTERED_HOST_STARTS[pos]
+    return start + arr.nbytes <= reg_ptr + _REGISTERED_HOST_ARRAYS[reg_ptr].nbytes
+
+def _flat_weights_to_device(flat_weights: np.ndarray, device: torch.device, out: torch.Tensor | None = None) -> torch.Tensor:
+    """
+    Moves a flat float32 (or float16) numpy vector to device as a single transfer; the result is float32.
+    float16 input crosses the bus at half width and is up-cast on the device.
+    For CUDA, the data is staged through a reused pinned buffer and copied with non_blocking=True.
+    If `out` is given, the data is copied into it instead of a new tensor.
+    """
+    if device.type != 'cuda':
+        host_tensor = torch.from_numpy(flat_weights)
+        return out.copy_(host_tensor) if out is not None else host_tensor.to(device, torch.float32)
+
+    if _is_registered_host_array(flat_weights):
+        # Already page-locked in place: DMA straight from the numpy memory, no staging copy
+        host_tensor = torch.from_numpy(flat_weights)
+        return out.copy_(host_tensor, non_blocking=True) if out is not None else host_tensor.to(device, non_blocking=True).float()
+
+    numel = flat_weights.size
+    cache_key = (numel, (torch.float16 if flat_weights.dtype == np.float16 else torch.float32))
+    if cache_key not in _PINNED_CACHE:
+        while len(_PINNED_CACHE) >= _PINNED_CACHE_MAX_ENTRIES:
+            _, (_, evicted_event) = _PINNED_CACHE.popitem(last=False) # Least recently used
+            if evicted_event is not None:
+                evicted_event.synchronize() # Its last DMA must finish before the buffer is freed
+        _PINNED_CACHE[cache_key] = (torch.empty(numel, dtype=cache_key[1], pin_memory=True), None)
+    _PINNED_CACHE.move_to_end(cache_key)
+    host_buffer, last_copy_event = _PINNED_CACHE[cache_key]
+    if last_copy_event is not None:
+        last_copy_event.synchronize() # Previous DMA out of this buffer must finish before it is overwritten
+
+    np.copyto(host_buffer.numpy(), flat_weights)
+    if out is not None:
+        device_tensor = out.copy_(host_buffer, non_blocking=True) # Non-blocking copies convert dtype on the device
+    else:
+        device_tensor = host_buffer.to(device, non_blocking=True).float()
+    copy_event = torch.cuda.Event()
+    copy_event.record()
+    _PINNED_CACHE[cache_key] = (host_buffer, copy_event)
+    return device_tensor
+
+class _WeightPrefetcher:
+    """
+    Double-buffered host->GPU upload of flat weight vectors on a side CUDA stream.
+    While individual i is evaluated on the compute stream, individual i+1's weights upload into the other slot.
+    """
+    def __init__(self, device: torch.device):
+        self.device = device
+        self.upload_stream = torch.cuda.Stream(device=device)
+        # Per slot: pinned host buffer, device buffer, numel in use,
+        # ready event (upload finished) and consumed event (compute finished reading device buffer)
+        self.host_bufs: List[torch.Tensor | None] = [None, None]
+        self.dev_bufs: List[torch.Tensor | None] = [None, None]
+        self.numels = [0, 0]
+        self.ready_events: List[Any] = [None, None]
+        self.consumed_events: List[Any] = [None, None]
+
+    def submit(self, slot: int, flat_weights: np.ndarray | None):
+        """ Starts the async upload of flat_weights into slot. None marks the slot empty. """
+        if flat_weights is None:
+            self.numels[slot] = 0
+            return
+        numel = flat_weights.size
+        host_dtype = (torch.float16 if flat_weights.dtype == np.float16 else torch.float32)
+        if self.ready_events[slot] is not None:
+            self.ready_events[slot].synchronize() # Previous DMA out of the host buffer must finish before reuse
+        if self.dev_bufs[slot] is None or self.dev_bufs[slot].numel() < numel:
+            self.dev_bufs[slot] = torch.empty(numel, dtype=torch.float32, device=self.device)
+            self.consumed_events[slot] = None
+        if self.host_bufs[slot] is None or self.host_bufs[slot].numel() < numel or self.host_bufs[slot].dtype != host_dtype:
+            self.host_bufs[slot] = torch.empty(numel, dtype=host_dtype, pin_memory=True)
+
+        if _is_registered_host_array(flat_weights):
+            host_src = torch.from_numpy(flat_weights) # Already page-locked in place, no staging copy
+        else:
+            host_src = self.host_bufs[slot][:numel]
+            np.copyto(host_src.numpy(), flat_weights)
+
+        with torch.cuda.stream(self.upload_stream):
+            if self.consumed_events[slot] is not None:
+                self.upload_stream.wait_event(self.consumed_events[slot]) # Compute must be done with the old contents
+            self.dev_bufs[slot][:numel].copy_(host_src, non_blocking=True) # float16 sources are up-cast on the device
+            # Allocated on the compute stream but written here: keep the allocator from reusing it while in flight
+            self.dev_bufs[slot].record_stream(self.upload_stream)
+            self.ready_events[slot] = torch.cuda.Event()
+            self.ready_events[slot].record(self.upload_stream)
+        self.numels[slot] = numel
+
+    def acquire(self, slot: int) -> torch.Tensor:
+        """ Makes the current stream wait for slot's upload and returns the on-device flat weights. """
+        if self.numels[slot] == 0:
+            raise ValueError("No weights were uploaded for this individual.")
+        torch.cuda.current_stream(self.device).wait_event(self.ready_events[slot])
+        return self.dev_bufs[slot][:self.numels[slot]]
+
+    def finish(self):
+        """ Orders the compute stream after any still-running upload (e.g. one whose individual failed before acquire). """
+        torch.cuda.current_stream(self.device).wait_stream(self.upload_stream)
+
+    def release(self, slot: int):
+        """ Marks slot's device buffer as consumed so the next upload into it may start. """
+        event = torch.cuda.Event()
+        event.record(torch.cuda.current_stream(self.device))
+        self.consumed_events[slot] = event
+
+def _chromosome_weights(chromosome: np.ndarray, num_hyperparams: int) -> np.ndarray | None:
+    """ Returns the chromosome's weight genes as a contiguous float32/float16 vector, or None if it has none. """
+    if len(chromosome) <= num_hyperparams: return None
+    return np.ascontiguousarray(chromosome[num_hyperparams:], dtype=_host_weight_dtype(chromosome))
+
+def _host_weight_dtype(arr: np.ndarray) -> np.dtype:
+    """ float16 arrays stay half precision for the transfer; anything else is sent as float32. """
+    return np.dtype(np.float16) if arr.dtype == np.float16 else np.dtype(np.float32)
+
 def flatten_weights(model: nn.Module) -> np.ndarray:
     """ Flattens all model parameters into a single numpy vector. """
     try:
-        weights = []
-        for param in model.parameters():
-            if param.requires_grad:
-                weights.append(param.data.cpu().numpy().flatten())
+        weights = [param.detach().reshape(-1) for param in model.parameters() if param.requires_grad]
         if not weights:
             logger.warning("No trainable parameters found in the model to flatten.")
             return np.array([], dtype=np.float32) # Return typed empty array
-        return np.concatenate(weights).astype(np.float32) # Ensure float32
+        # Concatenate on the model's device, then one device->host copy; .numpy() is a view of that CPU tensor
+        return torch.cat(weights).to(dtype=torch.float32).cpu().numpy() # Ensure float32
     except Exception as e:
         logger.error(f"Error during weight flattening: {e}", exc_info=True)
         raise
@@ -33,42 +301,23 @@ def flatten_weights(model: nn.Module) -> np.ndarray:
 def load_weights_from_flat(model: nn.Module, flat_weights: np.ndarray):
     """ Loads flattened weights back into a model instance. Assumes flat_weights contains ONLY weights. """
     try:
-        offset = 0
-        # Ensure input is numpy float32
+        # Ensure input is numpy float32 (float16 is kept and up-cast on the device)
         if not isinstance(flat_weights, np.ndarray): flat_weights = np.array(flat_weights)
-        flat_weights = flat_weights.astype(np.float32)
+        flat_weights = np.ascontiguousarray(flat_weights, dtype=_host_weight_dtype(flat_weights))
 
-        flat_weights_tensor = torch.from_numpy(flat_weights)
-        model_device = next(model.parameters()).device
-
-        # Compare against model parameter count
-        total_elements_in_model = sum(p.numel() for p in model.parameters() if p.requires_grad)
-        if total_elements_in_model != len(flat_weights_tensor):
+        # Compare against the cached model parameter count (offsets were laid out from the same specs,
+        # so a matching total means every slice below fits exactly); checked before any transfer
+        copy_plan, total_elements_in_model = _get_param_copy_plan(model)
+        if total_elements_in_model != flat_weights.size:
              # This is now more likely if num_hyperparams is wrong, make it an error
-             error_msg = f"Weight Size mismatch: Model requires {total_elements_in_model} elements, but flat_weights has {len(flat_weights_tensor)}. Check hyperparam count or model architecture."
+             error_msg = f"Weight Size mismatch: Model requires {total_elements_in_model} elements, but flat_weights has {flat_weights.size}. Check hyperparam count or model architecture."
              logger.error(error_msg)
              raise ValueError(error_msg)
+        if total_elements_in_model == 0: return
 
-        for param in model.parameters():
-            if param.requires_grad:
-                numel = param.numel()
-                param_shape = param.size()
-                if offset + numel > len(flat_weights_tensor):
-                    error_msg = f"Shape mismatch: Not enough data in flat_weights (len {len(flat_weights_tensor)}) to fill parameter {param_shape} (needs {numel} at offset {offset})"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-
-                # Slice, reshape, move to device, and copy
-                param_slice = flat_weights_tensor[offset:offset + numel].view(param_shape).to(model_device)
-                with torch.no_grad():
-                    param.data.copy_(param_slice)
-                offset += numel
-
-        # Final check (should always match if initial check passed)
-        if offset != len(flat_weights_tensor):
-            logger.error(f"Critical Size mismatch after loading weights. Offset {offset} != weights length {len(flat_weights_tensor)}.")
-            # This indicates a logic error, raise it
-            raise RuntimeError("Internal error during weight loading: size mismatch detected.")
+        # Single transfer of the whole vector; slice views of it are copied in one fused multi-tensor kernel
+        flat_weights_tensor = _flat_weights_to_device(flat_weights, next(model.parameters()).device)
+        _copy_flat_into_params(copy_plan, flat_weights_tensor)
 
     except Exception as e:
         logger.error(f"Error loading weights from flat vector: {e}", exc_info=True)
@@ -130,13 +379,7 @@ def load_pytorch_model(
         if not os.path.exists(norm_model_path):
              raise FileNotFoundError(f"Model definition file not found at {norm_model_path}")
 
-        module_name = f"model_module_{random.randint(1000, 9999)}_{os.path.basename(norm_model_path).split('.')[0]}" # Unique name
-        spec = importlib.util.spec_from_file_location(module_name, norm_model_path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Could not load spec for module at {norm_model_path}")
-
-        model_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(model_module)
+        model_module = _load_model_module(norm_model_path)
 
         if not hasattr(model_module, class_name):
             available_classes = [name for name, obj in model_module.__dict__.items() if isinstance(obj, type)]
@@ -172,13 +415,19 @@ def load_pytorch_model(
         raise
 
 def load_task_eval_function(task_module_path: str) -> callable:
-    """ Loads the fitness evaluation function (expecting name 'evaluate_model'). """
+    """
+    Loads the fitness evaluation function (expecting name 'evaluate_model').
+    The model passed to it is reused for every individual with the same hyperparameters; only the trainable
+    parameters are overwritten between calls. The function must not change the model in place (train mode,
+    buffers such as BatchNorm running stats, non-trainable params): such changes carry over to later individuals.
+    """
     try:
         norm_eval_path = os.path.normpath(task_module_path)
         if not os.path.exists(norm_eval_path):
             raise FileNotFoundError(f"Evaluation script not found at {norm_eval_path}")
 
-        module_name = f"eval_module_{random.randint(1000, 9999)}_{os.path.basename(norm_eval_path).split('.')[0]}" # Unique name
+        # Stable name per path, like _load_model_module (no draw from the GA Generator)
+        module_name = f"eval_module_{abs(hash(norm_eval_path)):x}_{os.path.basename(norm_eval_path).split('.')[0]}"
         spec = importlib.util.spec_from_file_location(module_name, norm_eval_path)
         if spec is None or spec.loader is None:
             raise ImportError(f"Could not load spec for module at {norm_eval_path}")
@@ -200,6 +449,12 @@ def load_task_eval_function(task_module_path: str) -> callable:
         logger.info(f"Loaded evaluation function '{eval_func_name}' from {norm_eval_path}")
         eval_func = getattr(task_module, eval_func_name)
 
+        # Optional vectorized entry point: `(population_model_fn, config) -> list of N fitnesses`
+        batched_func_name = 'evaluate_population_batched'
+        if hasattr(task_module, batched_func_name):
+            eval_func.batched_eval = getattr(task_module, batched_func_name)
+            logger.info(f"Found vectorized evaluation function '{batched_func_name}' in {norm_eval_path}")
+
         # Check signature (optional but recommended)
         import inspect
         sig = inspect.signature(eval_func)
@@ -212,9 +467,86 @@ def load_task_eval_function(task_module_path: str) -> callable:
         logger.error(f"Error loading task evaluation function: {e}", exc_info=True)
         raise
 
+def _sanitize_fitness(fitness: Any, individual_idx: int) -> float:
+    """ Converts a raw fitness value to float, mapping non-numeric/non-finite values to -inf. """
+    if isinstance(fitness, torch.Tensor) and fitness.numel() == 1:
+        fitness = fitness.item()
+    if isinstance(fitness, np.generic):
+        fitness = fitness.item()
+    if not isinstance(fitness, (float, int)):
+        logger.warning(f"Ind {individual_idx+1}: Fitness non-numeric ({type(fitness)}). Setting -inf.")
+        return -float('inf')
+    if not np.isfinite(fitness):
+        logger.warning(f"Ind {individual_idx+1}: Fitness non-finite ({fitness}). Setting -inf.")
+        return -float('inf')
+    return float(fitness)
+
+def _build_param_specs(model: nn.Module) -> Tuple[List[Tuple[str, int, int, torch.Size]], int]:
+    """ Returns ([(name, offset, numel, shape), ...], total_numel) for the trainable parameters of model. """
+    param_specs = []
+    offset = 0
+    for name, param in model.named_parameters():
+        if param.requires_grad:
+            param_specs.append((name, offset, param.numel(), param.shape))
+            offset += param.numel()
+    return param_specs, offset
+
+def build_population_model_fn(base_model: nn.Module, population_weights: np.ndarray | List[np.ndarray], device: torch.device) -> callable:
+    """
+    Builds `model_fn(inputs) -> outputs` that runs every individual in a single vmapped forward pass.
+    Trainable parameters are stacked to shape (N, *param.shape); buffers are shared from base_model.
+    Output has a leading population dimension N.
+    """
+    num_individuals = len(population_weights)
+    param_specs, total_numel = _build_param_specs(base_model)
+
+    if isinstance(population_weights, np.ndarray) and population_weights.ndim == 2:
+        population_matrix = np.ascontiguousarray(population_weights, dtype=_host_weight_dtype(population_weights)) # Already one row per individual
+    else:
+        population_matrix = np.stack([np.asarray(w, dtype=np.float32) for w in population_weights])
+    if population_matrix.shape[1] != total_numel:
+        raise ValueError(f"Weight Size mismatch: Model requires {total_numel} elements, but population weights have {population_matrix.shape[1]}.")
+
+    # One host->device transfer for the whole population, then slice per parameter on device
+    population_tensor = torch.from_numpy(population_matrix).to(device).float() # float16 storage is up-cast on device
+    stacked_params = {
+        name: population_tensor[:, param_offset:param_offset + numel].reshape(num_individuals, *shape)
+        for name, param_offset, numel, shape in param_specs
+    }
+
+    vmapped_call = torch.vmap(functools.partial(torch.func.functional_call, base_model), in_dims=(0, None))
+
+    def population_model_fn(inputs):
+        return vmapped_call(stacked_params, (inputs,))
+    return population_model_fn
+
+def evaluate_population_vectorized(
+    population_weights: np.ndarray | List[np.ndarray], # Weight-only chromosomes (no hyperparams)
+    ModelClass: type,
+    batched_eval_func: callable,
+    device: torch.device,
+    model_args_static: List[Any],
+    model_kwargs_static: Dict[str, Any],
+    eval_config: Dict[str, Any]
+) -> List[float]:
+    """ Evaluates all individuals with one batched eval call. Requires a shared architecture. """
+    base_model = ModelClass(*model_args_static, **model_kwargs_static)
+    base_model.to(device)
+    base_model.eval()
+
+    population_model_fn = build_population_model_fn(base_model, population_weights, device)
+    with torch.no_grad():
+        config_for_eval = {**eval_config, 'device': device}
+        raw_scores = batched_eval_func(population_model_fn, config_for_eval)
+
+    raw_scores = list(raw_scores.tolist() if isinstance(raw_scores, (torch.Tensor, np.ndarray)) else raw_scores)
+    if len(raw_scores) != len(population_weights):
+        raise ValueError(f"Batched evaluation returned {len(raw_scores)} scores for {len(population_weights)} individuals.")
+    return [_sanitize_fitness(f, i) for i, f in enumerate(raw_scores)]
+
 # MODIFIED: Handles hyperparameter evolution
 def evaluate_population_step(
-    population: List[np.ndarray], # List of full chromosomes (hyperparams + weights)
+    population: np.ndarray | List[np.ndarray], # (P, L) matrix or list of full chromosomes (hyperparams + weights)
     model_definition_path: str,
     class_name: str,
     task_eval_func: callable,
@@ -226,20 +558,15 @@ def evaluate_population_step(
     evolvable_hyperparams_config: Dict[str, Dict[str, Any]] # Config for decoding
 ) -> List[float]:
     """ Evaluates fitness, handling hyperparameter decoding and dynamic model instantiation. """
-    fitness_scores = [-float('inf')] * len(population) # Initialize with failure sentinel
     num_individuals = len(population)
     evaluation_times = []
-    hyperparam_keys = list(evolvable_hyperparams_config.keys()) # Get keys for decoding
 
     logger.info(f"Evaluating {num_individuals} individuals with {num_hyperparams} hyperparameters...")
 
     # Pre-load the model CLASS definition once (reduces overhead in loop)
     # This part needs careful error handling as failure here affects all individuals
     try:
-        module_name = f"model_module_eval_{random.randint(1000, 9999)}"
-        spec = importlib.util.spec_from_file_location(module_name, model_definition_path)
-        model_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(model_module)
+        model_module = _load_model_module(model_definition_path)
         ModelClass = getattr(model_module, class_name)
         logger.debug(f"Successfully pre-loaded ModelClass '{class_name}' for evaluation.")
     except Exception as e:
@@ -247,11 +574,89 @@ def evaluate_population_step(
          # Cannot proceed if model class cannot be loaded
          raise RuntimeError(f"Failed to load ModelClass '{class_name}' for evaluation.") from e
 
+    # Vectorized path: only when all individuals share one architecture (no evolved hyperparams)
+    # and the task script provides a vmap-safe batched evaluator. Otherwise evaluate one-by-one.
+    batched_eval_func = getattr(task_eval_func, 'batched_eval', None)
+    if batched_eval_func is not None and num_hyperparams == 0:
+        batch_start_time = time.time()
+        try:
+            fitness_scores = evaluate_population_vectorized(
+                population, ModelClass, batched_eval_func, device,
+                model_args_static, model_kwargs_static, eval_config
+            )
+            valid_count = sum(1 for f in fitness_scores if f > -float('inf'))
+            logger.info(f"Finished vectorized evaluation ({valid_count}/{num_individuals} valid). Total time: {time.time() - batch_start_time:.3f}s")
+            return fitness_scores
+        except Exception as e:
+            logger.warning(f"Vectorized evaluation failed ({e}). Falling back to per-individual evaluation.", exc_info=True)
+
+    # Page-lock float32 weight vectors in place so uploads skip the pinned staging copy.
+    # A population matrix is not registered here: its owner pins its persistent buffers once for the whole run
+    # (re-registering P x W bytes every generation costs as much as the staging copy it saves).
+    pinned_arrays = []
+    if device.type == 'cuda' and not (isinstance(population, np.ndarray) and population.ndim == 2):
+        for chromosome in population:
+            if isinstance(chromosome, np.ndarray) and chromosome.dtype == np.float32 and len(chromosome) > num_hyperparams:
+                weights_view = chromosome[num_hyperparams:]
+                if pin_numpy_inplace(weights_view):
+                    pinned_arrays.append(weights_view)
+
+    try:
+        fitness_scores = _evaluate_individuals(
+            population, ModelClass, task_eval_func, device, model_args_static, model_kwargs_static,
+            eval_config, num_hyperparams, evolvable_hyperparams_config, evaluation_times
+        )
+    finally:
+        for weights_view in pinned_arrays:
+            unpin_numpy(weights_view)
+
+    # Never per individual: the caching allocator reuses same-shape blocks across individuals. Evolved hyperparams
+    # can rebuild models of different sizes, so release the leftover blocks once per generation in that case only.
+    if device.type == 'cuda' and num_hyperparams > 0:
+        torch.cuda.empty_cache()
+
+    avg_eval_time = np.mean(evaluation_times) if evaluation_times else 0
+    valid_count = sum(1 for f in fitness_scores if f > -float('inf'))
+    logger.info(f"Finished evaluation ({valid_count}/{num_individuals} valid). Avg time/ind: {avg_eval_time:.3f}s")
+    return fitness_scores
+
+def _evaluate_individuals(
+    population: np.ndarray | List[np.ndarray],
+    ModelClass: type,
+    task_eval_func: callable,
+    device: torch.device,
+    model_args_static: List[Any],
+    model_kwargs_static: Dict[str, Any],
+    eval_config: Dict[str, Any],
+    num_hyperparams: int,
+    evolvable_hyperparams_config: Dict[str, Dict[str, Any]],
+    evaluation_times: List[float]
+) -> List[float]:
+    """ Per-individual evaluation loop used by evaluate_population_step. Appends per-individual times to evaluation_times. """
+    fitness_scores = [-float('inf')] * len(population) # Initialize with failure sentinel
+    hyperparam_keys = list(evolvable_hyperparams_config.keys())
+
+    # One reusable model instance: rebuilt only when the (static + evolved) kwargs change, so weights are
+    # copied into the existing parameter storage instead of re-allocating a fresh module per individual.
+    current_model = None
+    current_kwargs = None
+    weight_buffer = None # Preallocated device buffer holding the current individual's flat weights
+
+    # On CUDA, upload individual i+1's weights on a side stream while individual i is evaluated
+    prefetcher = _WeightPrefetcher(device) if device.type == 'cuda' else None
+    if prefetcher is not None and len(population) > 0:
+        prefetcher.submit(0, _chromosome_weights(population[0], num_hyperparams))
 
     for i, chromosome in enumerate(population):
         individual_start_time = time.time()
-        current_model = None
         decoded_hparams = {}
+        slot = i % 2
+        if prefetcher is not None and i + 1 < len(population):
+            try:
+                prefetcher.submit((i + 1) % 2, _chromosome_weights(population[i + 1], num_hyperparams))
+            except Exception as e:
+                logger.error(f"Error uploading weights for individual {i+2}: {e}", exc_info=True)
+                prefetcher.submit((i + 1) % 2, None) # Individual i+2 will fail when its turn comes
         try:
             # 1. Separate and Decode Hyperparameters
             if num_hyperparams > 0:
@@ -263,57 +668,126 @@ def evaluate_population_step(
                  # If no hyperparams evolved, decoded_hparams remains empty
                  pass
 
-            # 2. Instantiate Model with Evolved Hyperparameters + Static Config
+            # 2. Instantiate Model with Evolved Hyperparameters + Static Config (only if kwargs changed)
             combined_kwargs = {**model_kwargs_static, **decoded_hparams}
-            # Note: load_pytorch_model now handles instantiation with combined kwargs
-            current_model = ModelClass(*model_args_static, **combined_kwargs)
-            current_model.to(device)
-
-            # 3. Load Weights
+            if current_model is None or combined_kwargs != current_kwargs:
+                current_model = None # Release the previous instance before building a new one
+                current_model = ModelClass(*model_args_static, **combined_kwargs)
+                current_model.to(device)
+                current_model.eval()
+                current_kwargs = combined_kwargs
+
+            # Re-validated per individual: the previous eval call may have converted the shared model's parameters
+            copy_plan, total_numel = _get_param_copy_plan(current_model)
+            if prefetcher is None and (weight_buffer is None or weight_buffer.numel() != total_numel):
+                weight_buffer = torch.empty(total_numel, dtype=torch.float32, device=device)
+
+            # 3. Load Weights (copied into the existing parameter storage, no re-allocation)
             if len(chromosome) > num_hyperparams:
-                weights_vector = chromosome[num_hyperparams:]
-                load_weights_from_flat(current_model, weights_vector)
+                if prefetcher is not None:
+                    device_weights = prefetcher.acquire(slot) # Uploaded during the previous individual's eval
+                else:
+                    device_weights = _flat_weights_to_device(_chromosome_weights(chromosome, num_hyperparams), device, out=weight_buffer)
+                if device_weights.numel() != total_numel:
+                    raise ValueError(f"Weight Size mismatch: Model requires {total_numel} elements, but flat_weights has {device_weights.numel()}. Check hyperparam count or model architecture.")
+                _copy_flat_into_params(copy_plan, device_weights)
+                if prefetcher is not None:
+                    prefetcher.release(slot)
             # else: only hyperparams evolved, use initial model weights (already set by ModelClass init)
 
             # 4. Evaluate
             current_model.eval()
-            with torch.no_grad():
+            # inference_mode (stronger than no_grad: no version counters / view tracking) even if the eval script
+            # forgets to disable grad. Parameter layout still keys on requires_grad, so params are not frozen.
+            with torch.inference_mode():
                 # Call user's function: (model, device, config_dict)
                 # Ensure eval_config contains the device before calling
                 config_for_eval = {**eval_config, 'device': device} # Merge device into the config copy
                 fitness = task_eval_func(current_model, config_for_eval) # Pass model and combined config
 
-            # Validate fitness value
-            if not isinstance(fitness, (float, int)):
-                logger.warning(f"Ind {i+1}: Fitness non-numeric ({type(fitness)}). Setting -inf.")
-                fitness = -float('inf')
-            elif not np.isfinite(fitness):
-                logger.warning(f"Ind {i+1}: Fitness non-finite ({fitness}). Setting -inf.")
-                fitness = -float('inf')
-
-            fitness_scores[i] = float(fitness) # Store valid float or -inf
+            fitness_scores[i] = _sanitize_fitness(fitness, i) # Store valid float or -inf
 
         except Exception as e:
             logger.error(f"Error evaluating individual {i+1} (HParams: {decoded_hparams}): {e}", exc_info=True)
             # fitness_scores[i] remains -inf (already initialized)
         finally:
-            # Cleanup
-            del current_model # Ensure model object is released
-            if device.type == 'cuda':
-                torch.cuda.empty_cache() # Clear CUDA cache
             eval_time = time.time() - individual_start_time
             evaluation_times.append(eval_time)
 
-    avg_eval_time = np.mean(evaluation_times) if evaluation_times else 0
-    valid_count = sum(1 for f in fitness_scores if f > -float('inf'))
-    logger.info(f"Finished evaluation ({valid_count}/{num_individuals} valid). Avg time/ind: {avg_eval_time:.3f}s")
+    if prefetcher is not None:
+        prefetcher.finish()
     return fitness_scores
 
 # --- Genetic Algorithm Operators (Modified for Hyperparams + Weights) ---
 
 # --- Selection Operators ---
-# These operate on fitness scores and return selected *chromosomes* (which contain hyperparams+weights)
-# No fundamental change needed to tournament/roulette logic itself, just ensure they receive/return full chromosomes
+# select_parent_indices_* work on fitness scores alone and return row indices into the population matrix.
+# select_parents_* wrap them for callers holding a list of chromosomes and return the selected *chromosomes*.
+
+_TOURNAMENT_REDRAW_ROUNDS = 8 # Vectorized redraw passes before falling back to per-row choice(replace=False)
+
+def select_parent_indices_tournament(
+    fitness_scores: List[float] | np.ndarray,
+    num_parents: int,
+    tournament_size: int = 3
+) -> np.ndarray:
+    """ Tournament selection over all tournaments at once. Returns indices of the winners (-inf scores never win). """
+    fitness_np = np.asarray(fitness_scores, dtype=np.float64)
+    if fitness_np.size == 0 or num_parents <= 0: return np.empty(0, dtype=np.intp)
+    valid_indices = np.flatnonzero(fitness_np > -np.inf)
+    if valid_indices.size == 0:
+        logger.warning("No valid individuals for tournament selection.")
+        return np.empty(0, dtype=np.intp)
+
+    actual_tournament_size = max(2, min(fitness_np.size, tournament_size))
+    participants_count = min(valid_indices.size, actual_tournament_size)
+    # One row per tournament: (num_parents, participants_count) contestant indices, winner = row-wise argmax.
+    # Contestants are distinct within a tournament unless there are fewer valid individuals than seats.
+    contestant_pos = _rng.integers(valid_indices.size, size=(num_parents, participants_count))
+    if valid_indices.size >= actual_tournament_size:
+        # Redraw only rows holding a repeated contestant (rare when k << V); O(num_parents * k) memory
+        for _ in range(_TOURNAMENT_REDRAW_ROUNDS):
+            sorted_pos = np.sort(contestant_pos, axis=1)
+            dup_rows = np.flatnonzero((sorted_pos[:, 1:] == sorted_pos[:, :-1]).any(axis=1))
+            if dup_rows.size == 0: break
+            contestant_pos[dup_rows] = _rng.integers(valid_indices.size, size=(dup_rows.size, participants_count))
+        else: # Small pools where collisions stay likely: finish the remaining rows one by one
+            sorted_pos = np.sort(contestant_pos, axis=1)
+            for row in np.flatnonzero((sorted_pos[:, 1:] == sorted_pos[:, :-1]).any(axis=1)):
+                contestant_pos[row] = _rng.choice(valid_indices.size, size=participants_count, replace=False)
+    contestants = valid_indices[contestant_pos]
+    winners = np.argmax(fitness_np[contestants], axis=1)
+    return contestants[np.arange(num_parents), winners]
+
+def select_parent_indices_roulette(
+    fitness_scores: List[float] | np.ndarray,
+    num_parents: int
+) -> np.ndarray:
+    """ Roulette Wheel selection. Returns indices of the selected individuals. """
+    fitness_np = np.asarray(fitness_scores, dtype=np.float64)
+    if fitness_np.size == 0 or num_parents <= 0: return np.empty(0, dtype=np.intp)
+
+    valid_indices = np.where(fitness_np > -np.inf)[0]
+    if len(valid_indices) == 0:
+         logger.warning("Roulette: All invalid fitness. Selecting uniformly.")
+         return _rng.choice(fitness_np.size, size=num_parents, replace=True)
+    valid_fitness = fitness_np[valid_indices]
+    if valid_fitness.max() <= 0: # All non-positive: shift so the worst valid score gets a tiny positive weight
+        shifted_fitness = valid_fitness - valid_fitness.min() + 1e-9
+    else: # At least one positive score exists: zero out any negatives
+        shifted_fitness = np.maximum(valid_fitness, 0)
+
+    # Cumulative weights once, then one vectorized binary search for all draws (no per-call cdf as in choice(p=...)).
+    # side='right' never lands on zero-weight entries.
+    cdf = np.cumsum(shifted_fitness)
+    total_fitness = cdf[-1]
+    if not total_fitness > 0:
+         logger.warning("Roulette: Total fitness zero after shift. Selecting uniformly among valid.")
+         return _rng.choice(valid_indices, size=num_parents, replace=True)
+
+    selected_indices_in_valid = np.searchsorted(cdf, _rng.random(num_parents) * total_fitness, side='right')
+    np.minimum(selected_indices_in_valid, len(valid_indices) - 1, out=selected_indices_in_valid) # Guard float round-off at the top end
+    return valid_indices[selected_indices_in_valid]
 
 def select_parents_tournament(
     population_chromosomes: List[np.ndarray], # Changed name for clarity
@@ -322,33 +796,9 @@ def select_parents_tournament(
     tournament_size: int = 3
 ) -> List[np.ndarray]:
     """ Selects parent chromosomes using tournament selection. """
-    parents = []
-    population_size = len(population_chromosomes)
-    if population_size == 0 or num_parents <= 0: return []
-    # ... (Rest of tournament logic remains the same, operating on indices) ...
-    actual_tournament_size = max(2, min(population_size, tournament_size))
-    valid_indices = [i for i, f in enumerate(fitness_scores) if f > -float('inf')]
-    if not valid_indices:
-        logger.warning("No valid individuals for tournament selection.")
-        return []
-    num_valid = len(valid_indices)
-    for _ in range(num_parents):
-        participants_count = min(num_valid, actual_tournament_size)
-        if participants_count < 1: break
-        replace = num_valid < actual_tournament_size
-        tournament_indices = np.random.choice(valid_indices, size=participants_count, replace=replace).tolist()
-        winner_idx_in_pop = -1
-        best_fit_tourn = -float('inf')
-        for idx in tournament_indices:
-            if fitness_scores[idx] > best_fit_tourn:
-                best_fit_tourn = fitness_scores[idx]
-                winner_idx_in_pop = idx
-        if winner_idx_in_pop != -1:
-            parents.append(population_chromosomes[winner_idx_in_pop]) # Return selected chromosome
-        elif valid_indices:
-            logger.warning("Tournament failed to select winner, picking random valid.")
-            parents.append(population_chromosomes[random.choice(valid_indices)])
-    return parents
+    if len(population_chromosomes) == 0 or num_parents <= 0: return []
+    selected_indices = select_parent_indices_tournament(fitness_scores, num_parents, tournament_size)
+    return [population_chromosomes[i] for i in selected_indices]
 
 def select_parents_roulette(
     population_chromosomes: List[np.ndarray], # Changed name for clarity
@@ -356,45 +806,10 @@ def select_parents_roulette(
     num_parents: int
 ) -> List[np.ndarray]:
     """ Selects parent chromosomes using Roulette Wheel selection. """
-    # ... (Input validation remains the same) ...
-    if not population_chromosomes or not fitness_scores or len(population_chromosomes) != len(fitness_scores): raise ValueError("Population/fitness mismatch.")
+    if len(population_chromosomes) == 0 or len(fitness_scores) == 0 or len(population_chromosomes) != len(fitness_scores): raise ValueError("Population/fitness mismatch.")
     if num_parents <= 0: return []
-
-    fitness_np = np.array(fitness_scores, dtype=np.float64)
-    valid_indices = np.where(fitness_np > -np.inf)[0]
-    # ... (Handling invalid/non-positive fitness remains the same) ...
-    if len(valid_indices) == 0:
-         logger.warning("Roulette: All invalid fitness. Selecting uniformly.")
-         indices = np.random.choice(len(population_chromosomes), size=num_parents, replace=True)
-         return [population_chromosomes[i] for i in indices]
-    valid_fitness = fitness_np[valid_indices]
-    if np.all(valid_fitness <= 0):
-        min_valid = np.min(valid_fitness)
-        if min_valid > -np.inf: # Check if there's at least one non -inf score
-            shifted_fitness = valid_fitness - min_valid + 1e-9 # Shift to positive
-        else: # All valid scores are -inf, select uniformly
-             logger.warning("Roulette: All valid fitness scores are -inf. Selecting uniformly.")
-             selected_valid_indices = np.random.choice(valid_indices, size=num_parents, replace=True)
-             return [population_chromosomes[i] for i in selected_valid_indices]
-    else: # At least one positive score exists
-        shifted_fitness = valid_fitness.copy()
-        shifted_fitness[shifted_fitness < 0] = 0 # Zero out any remaining negatives
-
-    total_fitness = np.sum(shifted_fitness)
-    if total_fitness <= 0:
-         logger.warning("Roulette: Total fitness zero after shift. Selecting uniformly among valid.")
-         selected_valid_indices = np.random.choice(valid_indices, size=num_parents, replace=True)
-         return [population_chromosomes[i] for i in selected_valid_indices]
-
-    probabilities = shifted_fitness / total_fitness
-    probabilities /= np.sum(probabilities) # Re-normalize
-
-    # Select indices from the *valid* subset based on probability
-    selected_indices_in_valid = np.random.choice(len(valid_indices), size=num_parents, replace=True, p=probabilities)
-    # Map back to original population indices
-    selected_original_indices = valid_indices[selected_indices_in_valid]
-    selected_parents = [population_chromosomes[i] for i in selected_original_indices]
-    return selected_parents
+    selected_indices = select_parent_indices_roulette(fitness_scores, num_parents)
+    return [population_chromosomes[i] for i in selected_indices]
 
 
 # --- Crossover Operators ---
@@ -415,36 +830,43 @@ def crossover_average(parent1: np.ndarray, parent2: np.ndarray, num_hyperparams:
     child = np.concatenate((h_child, w_child))
     return child.copy(), child.copy() # Returns two identical children
 
-def crossover_one_point(parent1: np.ndarray, parent2: np.ndarray, num_hyperparams: int) -> tuple[np.ndarray, np.ndarray]:
-    """ One-point crossover for hyperparams and weights separately. """
+def crossover_one_point(
+    parent1: np.ndarray, parent2: np.ndarray, num_hyperparams: int,
+    out1: np.ndarray | None = None, out2: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """ One-point crossover for hyperparams and weights separately. Writes into out1/out2 if given. """
     p1, p2 = np.asarray(parent1), np.asarray(parent2)
     if p1.shape != p2.shape or len(p1) <= num_hyperparams:
         logger.warning("Shape mismatch/insufficient length for one-point crossover. Returning copies.")
-        return p1.copy(), p2.copy()
+        if out1 is not None: np.copyto(out1, p1)
+        if out2 is not None: np.copyto(out2, p2)
+        return (p1.copy() if out1 is None else out1), (p2.copy() if out2 is None else out2)
 
-    # Crossover Hyperparameters
+    # Children are filled by slice assignment into preallocated (or caller-owned) rows; no concatenate temporaries
+    child1 = np.empty_like(p1) if out1 is None else out1
+    child2 = np.empty_like(p2) if out2 is None else out2
+
+    # Crossover Hyperparameters: genes from the cut point on come from the other parent
+    child1[:num_hyperparams] = p1[:num_hyperparams]
+    child2[:num_hyperparams] = p2[:num_hyperparams]
     if num_hyperparams > 1:
-        hp_cross_pt = random.randint(1, num_hyperparams - 1)
-        h1_new = np.concatenate((p1[:hp_cross_pt], p2[hp_cross_pt:num_hyperparams]))
-        h2_new = np.concatenate((p2[:hp_cross_pt], p1[hp_cross_pt:num_hyperparams]))
+        hp_cross_pt = int(_rng.integers(1, num_hyperparams))
+        child1[hp_cross_pt:num_hyperparams] = p2[hp_cross_pt:num_hyperparams]
+        child2[hp_cross_pt:num_hyperparams] = p1[hp_cross_pt:num_hyperparams]
     elif num_hyperparams == 1: # Swap single hyperparam
-        h1_new, h2_new = p2[:1], p1[:1]
-    else: # No hyperparams
-        h1_new, h2_new = np.array([]), np.array([])
+        child1[0], child2[0] = p2[0], p1[0]
 
     # Crossover Weights
     weight_size = len(p1) - num_hyperparams
     if weight_size > 1:
-        wt_cross_pt = random.randint(1, weight_size - 1)
-        w1_new = np.concatenate((p1[num_hyperparams : num_hyperparams + wt_cross_pt], p2[num_hyperparams + wt_cross_pt :]))
-        w2_new = np.concatenate((p2[num_hyperparams : num_hyperparams + wt_cross_pt], p1[num_hyperparams + wt_cross_pt :]))
-    elif weight_size == 1: # Swap single weight
-        w1_new, w2_new = p2[num_hyperparams:], p1[num_hyperparams:]
-    else: # No weights (unlikely)
-        w1_new, w2_new = np.array([]), np.array([])
+        wt_cross_pt = num_hyperparams + int(_rng.integers(1, weight_size))
+        child1[num_hyperparams:wt_cross_pt] = p1[num_hyperparams:wt_cross_pt]
+        child1[wt_cross_pt:] = p2[wt_cross_pt:]
+        child2[num_hyperparams:wt_cross_pt] = p2[num_hyperparams:wt_cross_pt]
+        child2[wt_cross_pt:] = p1[wt_cross_pt:]
+    else: # Swap single weight
+        child1[num_hyperparams], child2[num_hyperparams] = p2[num_hyperparams], p1[num_hyperparams]
 
-    child1 = np.concatenate((h1_new, w1_new))
-    child2 = np.concatenate((h2_new, w2_new))
     return child1, child2
 
 def crossover_uniform(parent1: np.ndarray, parent2: np.ndarray, num_hyperparams: int, crossover_prob: float = 0.5) -> tuple[np.ndarray, np.ndarray]:
@@ -457,7 +879,7 @@ def crossover_uniform(parent1: np.ndarray, parent2: np.ndarray, num_hyperparams:
     # Crossover Hyperparameters
     h1_new, h2_new = p1[:num_hyperparams], p2[:num_hyperparams]
     if num_hyperparams > 0:
-        hp_swap_mask = np.random.rand(num_hyperparams) < crossover_prob
+        hp_swap_mask = _rng.random(num_hyperparams) < crossover_prob
         h1_new = np.where(hp_swap_mask, p2[:num_hyperparams], p1[:num_hyperparams])
         h2_new = np.where(hp_swap_mask, p1[:num_hyperparams], p2[:num_hyperparams])
 
@@ -465,7 +887,7 @@ def crossover_uniform(parent1: np.ndarray, parent2: np.ndarray, num_hyperparams:
     w1_new, w2_new = p1[num_hyperparams:], p2[num_hyperparams:]
     weight_size = len(w1_new)
     if weight_size > 0:
-        wt_swap_mask = np.random.rand(weight_size) < crossover_prob
+        wt_swap_mask = _rng.random(weight_size) < crossover_prob
         w1_new = np.where(wt_swap_mask, p2[num_hyperparams:], p1[num_hyperparams:])
         w2_new = np.where(wt_swap_mask, p1[num_hyperparams:], p2[num_hyperparams:])
 
@@ -486,7 +908,7 @@ def mutate_hyperparams_gaussian(chromosome: np.ndarray, mutation_strength: float
     hyperparams = mutated_chromosome[:num_hyperparams]
 
     # Apply Gaussian noise scaled by strength to ALL hyperparams for simplicity
-    noise = np.random.normal(0, mutation_strength, size=num_hyperparams).astype(hyperparams.dtype)
+    noise = _rng.normal(0, mutation_strength, size=num_hyperparams).astype(hyperparams.dtype)
     hyperparams += noise
 
     # Clamp based on ranges? Decoding function handles clamping, maybe not needed here.
@@ -510,14 +932,15 @@ def mutate_weights_gaussian(
     num_weights = weights.size
     if num_weights == 0: return chromosome
 
-    num_weights_to_mutate = int(num_weights * current_mutation_rate)
-    if num_weights_to_mutate == 0 and current_mutation_rate > 0: num_weights_to_mutate = 1 # Ensure at least one mutation
-    num_weights_to_mutate = min(num_weights_to_mutate, num_weights) # Cap at total
+    # Bernoulli mask: same expected count as picking int(n * rate) indices, without choice()'s O(n) permutation
+    mutation_mask = _rng.random(num_weights) < current_mutation_rate
+    num_mutations = np.count_nonzero(mutation_mask)
+    if num_mutations == 0: # Ensure at least one mutation
+        mutation_mask[_rng.integers(num_weights)] = True
+        num_mutations = 1
 
-    if num_weights_to_mutate > 0:
-        indices_to_mutate = np.random.choice(num_weights, num_weights_to_mutate, replace=False)
-        noise = np.random.normal(0, mutation_strength, size=num_weights_to_mutate).astype(weights.dtype)
-        weights[indices_to_mutate] += noise # Mutate weights in place
+    noise = _rng.normal(0, mutation_strength, size=num_mutations).astype(weights.dtype)
+    weights[mutation_mask] += noise # Mutate weights in place
 
     # No need to re-concatenate if 'weights' was a view, but copy ensures safety
     mutated_chromosome[num_hyperparams:] = weights
@@ -539,14 +962,158 @@ def mutate_weights_uniform_random(
     if num_weights == 0: return chromosome
 
     min_val, max_val = value_range
-    mutation_mask = np.random.rand(num_weights) < current_mutation_rate
+    mutation_mask = _rng.random(num_weights) < current_mutation_rate
     num_mutations = np.sum(mutation_mask)
 
     if num_mutations > 0:
-        new_values = np.random.uniform(min_val, max_val, size=num_mutations).astype(weights.dtype)
+        new_values = _rng.uniform(min_val, max_val, size=num_mutations).astype(weights.dtype)
         weights[mutation_mask] = new_values # Replace weights in place
 
     mutated_chromosome[num_hyperparams:] = weights
     return mutated_chromosome
 
+# --- Batched Operators ---
+# The task stores the population as one (P, L) float32 matrix, L = num_hyperparams + num_weights, one chromosome
+# per row. These operate on whole (K, L) blocks with row-wise numpy ops instead of per-chromosome Python calls.
+
+# Numba kernels: one fused pass per row (draw, test, update) with no mask/noise temporaries; rows run in parallel.
+# Each row reseeds Numba's thread-local RNG from a seed drawn off _rng, so results don't depend on thread scheduling.
+if _NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mutate_weights_gaussian_kernel(population, num_hyperparams, mutation_rate, mutation_strength, row_seeds):
+        num_rows, length = population.shape
+        num_weights = length - num_hyperparams
+        for row in prange(num_rows):
+            np.random.seed(row_seeds[row])
+            mutated = False
+            for j in range(num_hyperparams, length):
+                if np.random.random() < mutation_rate:
+                    population[row, j] += np.random.normal(0.0, mutation_strength)
+                    mutated = True
+            if not mutated: # Ensure at least one mutation per row
+                population[row, num_hyperparams + np.random.randint(0, num_weights)] += np.random.normal(0.0, mutation_strength)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _crossover_uniform_kernel(parents_a, parents_b, crossover_prob, row_seeds, children_1, children_2):
+        num_rows, length = parents_a.shape
+        for row in prange(num_rows):
+            np.random.seed(row_seeds[row])
+            for j in range(length):
+                if np.random.random() < crossover_prob:
+                    children_1[row, j] = parents_b[row, j]
+                    children_2[row, j] = parents_a[row, j]
+                else:
+                    children_1[row, j] = parents_a[row, j]
+                    children_2[row, j] = parents_b[row, j]
+
+    # No import-time warm-up: this module is imported by the API and the Celery master before the prefork pool
+    # forks, and a fork after the OpenMP threading layer has started kills the child. Kernels compile on first
+    # use inside the worker (cache=True makes later processes load them from disk).
+
+def _row_seeds(num_rows: int) -> np.ndarray:
+    """ Per-row seeds for the Numba kernels, drawn from the shared Generator. """
+    return _rng.integers(0, 2**31 - 1, size=num_rows, dtype=np.int64)
+
+def _children_buffers(parents_a: np.ndarray, out1: np.ndarray | None, out2: np.ndarray | None) -> tuple[np.ndarray, np.ndarray]:
+    """ Returns the caller's output rows, allocating any that were not supplied. """
+    return (np.empty_like(parents_a) if out1 is None else out1), (np.empty_like(parents_a) if out2 is None else out2)
+
+def crossover_one_point_batch(
+    parents_a: np.ndarray, parents_b: np.ndarray, num_hyperparams: int,
+    out1: np.ndarray | None = None, out2: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """ One-point crossover of each row pair, with independent cut points for hyperparams and weights. Writes into out1/out2 if given. """
+    num_pairs, length = parents_a.shape
+    take_b = np.zeros((num_pairs, length), dtype=bool) # True where child1 takes the gene from parents_b
+
+    if num_hyperparams > 1:
+        hp_cross_pts = _rng.integers(1, num_hyperparams, size=(num_pairs, 1))
+        take_b[:, :num_hyperparams] = np.arange(num_hyperparams) >= hp_cross_pts
+    elif num_hyperparams == 1: # Swap single hyperparam
+        take_b[:, 0] = True
+
+    weight_size = length - num_hyperparams
+    if weight_size > 1:
+        wt_cross_pts = _rng.integers(1, weight_size, size=(num_pairs, 1))
+        take_b[:, num_hyperparams:] = np.arange(weight_size) >= wt_cross_pts
+    elif weight_size == 1: # Swap single weight
+        take_b[:, num_hyperparams:] = True
+
+    children_1, children_2 = _children_buffers(parents_a, out1, out2)
+    np.copyto(children_1, parents_a); np.copyto(children_1, parents_b, where=take_b)
+    np.copyto(children_2, parents_b); np.copyto(children_2, parents_a, where=take_b)
+    return children_1, children_2
+
+def crossover_uniform_batch(
+    parents_a: np.ndarray, parents_b: np.ndarray, num_hyperparams: int, crossover_prob: float = 0.5,
+    out1: np.ndarray | None = None, out2: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """ Uniform crossover of each row pair (hyperparams and weights share one per-gene swap mask). Writes into out1/out2 if given. """
+    children_1, children_2 = _children_buffers(parents_a, out1, out2)
+    if (_NUMBA_AVAILABLE and parents_a.dtype == parents_b.dtype == children_1.dtype == children_2.dtype == np.float32
+            and children_1.flags['C_CONTIGUOUS'] and children_2.flags['C_CONTIGUOUS']):
+        parents_a, parents_b = np.ascontiguousarray(parents_a), np.ascontiguousarray(parents_b)
+        _crossover_uniform_kernel(parents_a, parents_b, crossover_prob, _row_seeds(parents_a.shape[0]), children_1, children_2)
+        return children_1, children_2
+    swap_mask = _rng.random(parents_a.shape) < crossover_prob
+    np.copyto(children_1, parents_a); np.copyto(children_1, parents_b, where=swap_mask)
+    np.copyto(children_2, parents_b); np.copyto(children_2, parents_a, where=swap_mask)
+    return children_1, children_2
+
+def crossover_average_batch(
+    parents_a: np.ndarray, parents_b: np.ndarray, num_hyperparams: int,
+    out1: np.ndarray | None = None, out2: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """ Average crossover of each row pair. Both children are the (identical) average. Writes into out1/out2 if given. """
+    children_1, children_2 = _children_buffers(parents_a, out1, out2)
+    np.add(parents_a, parents_b, out=children_1)
+    children_1 /= 2
+    np.copyto(children_2, children_1)
+    return children_1, children_2
+
+def mutate_hyperparams_gaussian_batch(population: np.ndarray, mutation_strength: float, num_hyperparams: int) -> np.ndarray:
+    """ Adds Gaussian noise to every hyperparameter gene of every row, in place. Returns population. """
+    if num_hyperparams <= 0 or mutation_strength <= 0: return population
+    hyperparams = population[:, :num_hyperparams]
+    hyperparams += _rng.normal(0, mutation_strength, size=hyperparams.shape).astype(population.dtype)
+    return population
+
+def mutate_weights_gaussian_batch(
+    population: np.ndarray,
+    current_mutation_rate: float,
+    mutation_strength: float,
+    num_hyperparams: int
+) -> np.ndarray:
+    """ Adds Gaussian noise to a Bernoulli(rate) fraction of each row's weights, in place. Returns population. """
+    weights = population[:, num_hyperparams:]
+    if current_mutation_rate <= 0 or mutation_strength <= 0 or weights.size == 0: return population
+    if _NUMBA_AVAILABLE and population.dtype == np.float32 and population.flags['C_CONTIGUOUS']:
+        _mutate_weights_gaussian_kernel(population, num_hyperparams, current_mutation_rate, mutation_strength, _row_seeds(population.shape[0]))
+        return population
+
+    mutation_mask = _rng.random(weights.shape) < current_mutation_rate
+    empty_rows = np.flatnonzero(~mutation_mask.any(axis=1)) # Ensure at least one mutation per row
+    mutation_mask[empty_rows, _rng.integers(weights.shape[1], size=empty_rows.size)] = True
+
+    noise = _rng.normal(0, mutation_strength, size=np.count_nonzero(mutation_mask)).astype(population.dtype)
+    weights[mutation_mask] += noise
+    return population
+
+def mutate_weights_uniform_random_batch(
+    population: np.ndarray,
+    current_mutation_rate: float,
+    value_range: Tuple[float, float],
+    num_hyperparams: int
+) -> np.ndarray:
+    """ Replaces a Bernoulli(rate) fraction of each row's weights with uniform random values, in place. Returns population. """
+    weights = population[:, num_hyperparams:]
+    if current_mutation_rate <= 0 or weights.size == 0: return population
+
+    min_val, max_val = value_range
+    mutation_mask = _rng.random(weights.shape) < current_mutation_rate
+    num_mutations = np.count_nonzero(mutation_mask)
+    if num_mutations > 0:
+        weights[mutation_mask] = _rng.uniform(min_val, max_val, size=num_mutations).astype(population.dtype)
+    return population
+
 # --- End of Helper Functions ---
@@ -3,11 +3,11 @@
 from app.core.celery_app import celery_app
 from celery import current_task, Task
 import time
-import random
 import os
 import numpy as np
 import torch
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple
 import redis
 from celery.exceptions import SoftTimeLimitExceeded
@@ -18,18 +18,19 @@ from app.core.config import settings
 from app.utils.evolution_helpers import (
     load_pytorch_model, flatten_weights, load_task_eval_function,
     evaluate_population_step, load_weights_from_flat,
-    decode_hyperparameters,
+    decode_hyperparameters, get_rng, POPULATION_DTYPES,
+    pin_numpy_inplace, unpin_numpy,
     # Selection
-    select_parents_tournament,
-    select_parents_roulette,
+    select_parent_indices_tournament,
+    select_parent_indices_roulette,
     # Crossover
-    crossover_one_point,
-    crossover_uniform,
-    crossover_average,
+    crossover_one_point_batch,
+    crossover_uniform_batch,
+    crossover_average_batch,
     # Mutation
-    mutate_hyperparams_gaussian,
-    mutate_weights_gaussian,
-    mutate_weights_uniform_random
+    mutate_hyperparams_gaussian_batch,
+    mutate_weights_gaussian_batch,
+    mutate_weights_uniform_random_batch
 )
 
 logger = logging.getLogger(__name__)
@@ -38,34 +39,36 @@ STANDARD_EVAL_SCRIPT_PATH = settings.STANDARD_EVAL_SCRIPT_PATH
 RESULT_DIR = settings.RESULT_DIR
 os.makedirs(RESULT_DIR, exist_ok=True)
 
+# Persistent host-side pool for GA work that only reads the population (no fitness), so it can run while the
+# population is evaluated on the device. numpy releases the GIL inside its kernels. Threads start lazily on first
+# submit, i.e. inside the (forked) worker process.
+_HOST_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ga-host")
+
 # --- Helper Function for Diversity (Modified) ---
-def calculate_population_diversity(population: list[np.ndarray], num_hyperparams: int) -> float:
-    """Calculates average pairwise Euclidean distance between the weight vectors."""
-    if not population or len(population) < 2 or num_hyperparams < 0: return 0.0
-    num_individuals = len(population)
-    weight_vectors = [ind[num_hyperparams:] for ind in population if isinstance(ind, np.ndarray) and len(ind) > num_hyperparams]
-    if len(weight_vectors) < 2: return 0.0
-    flat_weights = [w.flatten() for w in weight_vectors]
-    if len(flat_weights) < 2: return 0.0
-    first_len = len(flat_weights[0])
-    consistent_weights = [w for w in flat_weights if len(w) == first_len]
-    num_consistent = len(consistent_weights)
-    if num_consistent < 2:
-        logger.debug("Less than 2 consistent weight vectors for diversity calc.") # Less alarming
+_DIVERSITY_BLOCK_BYTES = 32 << 20 # Upper bound on the per-block temporary in calculate_population_diversity
+
+def calculate_population_diversity(population: np.ndarray, num_hyperparams: int) -> float:
+    """Calculates average pairwise Euclidean distance between the weight vectors (rows of the population matrix)."""
+    if population.ndim != 2 or population.shape[0] < 2 or num_hyperparams < 0: return 0.0
+    if population.shape[1] <= num_hyperparams:
+        logger.debug("No weight genes for diversity calc.") # Less alarming
         return 0.0
-    if num_consistent < num_individuals:
-         logger.debug(f"Using {num_consistent}/{num_individuals} individuals for diversity.") # Less alarming
+    weights = population[:, num_hyperparams:]
+    num_individuals, num_weights = weights.shape
+    # Rows per difference block: bounds the float32 temporary to ~_DIVERSITY_BLOCK_BYTES (at least one row)
+    block_rows = max(1, _DIVERSITY_BLOCK_BYTES // (num_weights * 4))
     total_distance = 0.0
-    num_pairs = 0
-    for i in range(num_consistent):
-        for j in range(i + 1, num_consistent):
-            try:
-                # Using float32 for potentially better performance on norm
-                distance = np.linalg.norm(consistent_weights[i].astype(np.float32) - consistent_weights[j].astype(np.float32))
-                total_distance += distance
-                num_pairs += 1
-            except (ValueError, FloatingPointError) as e: # Catch potential FP errors
-                 logger.warning(f"Error calculating distance between individuals {i} and {j}: {e}")
+    for i in range(num_individuals - 1):
+        row = weights[i].astype(np.float32, copy=False) # float16 squares overflow
+        for start in range(i + 1, num_individuals, block_rows):
+            block = weights[start:start + block_rows].astype(np.float32) # Own copy, reused for the difference
+            block -= row
+            distances = np.linalg.norm(block, axis=1)
+            finite = np.isfinite(distances)
+            if not finite.all():
+                logger.warning(f"Non-finite distances between individual {i} and {np.count_nonzero(~finite)} others; skipped.")
+            total_distance += float(distances[finite].sum())
+    num_pairs = num_individuals * (num_individuals - 1) // 2
     return float(total_distance / num_pairs) if num_pairs > 0 else 0.0
 
 # --- Task Base Class with Retry ---
@@ -160,6 +163,10 @@ def run_evolution_task(self: Task, model_definition_path: str, task_evaluation_p
         model_args = safe_convert('model_args', list, [])
         model_kwargs_static = safe_convert('model_kwargs', dict, {})
         eval_config = safe_convert('eval_config', dict, {})
+        population_dtype_name = safe_convert('population_dtype', str, 'float32').lower()
+        if population_dtype_name not in POPULATION_DTYPES:
+             logger.warning(f"Unsupported population_dtype '{population_dtype_name}', using float32.")
+             population_dtype_name = 'float32'
 
         # --- Hyperparameter Evolution Config ---
         evolvable_hyperparams_config: Dict[str, Dict[str, Any]] = config.get('evolvable_hyperparams', {})
@@ -167,6 +174,12 @@ def run_evolution_task(self: Task, model_definition_path: str, task_evaluation_p
         num_hyperparams: int = len(hyperparam_keys)
         logger.info(f"[Task {task_id}] Evolving {num_hyperparams} hyperparameters: {hyperparam_keys}")
         hyperparam_mutation_strength: float = safe_convert('hyperparam_mutation_strength', float, 0.02)
+        # Hyperparams share the chromosome row: in float16 their mutation noise rounds away (ulp >= 0.03 above ~32)
+        # and small ranges (e.g. lr ~1e-5) go subnormal, so float16 storage is only allowed for weight-only runs
+        if population_dtype_name == 'float16' and num_hyperparams > 0:
+             logger.warning(f"[Task {task_id}] population_dtype 'float16' is not supported with evolved hyperparameters; using float32.")
+             population_dtype_name = 'float32'
+        population_dtype = POPULATION_DTYPES[population_dtype_name]
 
         # --- GA Operator Config ---
         selection_strategy = safe_convert("selection_strategy", str, "tournament")
@@ -206,7 +219,7 @@ def run_evolution_task(self: Task, model_definition_path: str, task_evaluation_p
 
         logger.info(f"[Task {task_id}] Using device: {device}")
         if device.type == 'cuda': logger.info(f"[Task {task_id}] CUDA Device Name: {torch.cuda.get_device_name(0)}")
-        logger.info(f"[Task {task_id}] Config Summary: Gens={generations}, Pop={population_size}, Elitism={elitism_count}")
+        logger.info(f"[Task {task_id}] Config Summary: Gens={generations}, Pop={population_size}, Elitism={elitism_count}, PopDtype={population_dtype_name}")
         logger.info(f"[Task {task_id}] Operators: Select='{selection_strategy}', Cross='{crossover_operator}', Mut(W)='{mutation_operator}'")
         if use_dynamic_mutation_rate: logger.info(f"[Task {task_id}] Dynamic Rate(W) Enabled: H='{dynamic_mutation_heuristic}'")
         else: logger.info(f"[Task {task_id}] Fixed Rate(W): {mutation_rate:.3f}")
@@ -241,30 +254,31 @@ def run_evolution_task(self: Task, model_definition_path: str, task_evaluation_p
         if initial_weights.size == 0:
             raise ValueError("Initial weight vector size is zero. Cannot proceed.")
 
-        # 3. Generate initial population chromosomes
-        population: List[np.ndarray] = []
+        # 3. Generate initial population chromosomes: one (population_size, num_hyperparams + num_weights) matrix
+        # in population_dtype (float16 halves host memory and host->GPU bytes; weights are up-cast on the device)
+        rng = get_rng() # Shared GA Generator (same stream the helper operators draw from)
+        # Two persistent generation buffers alternate between current and next population, plus reusable parent
+        # blocks, so reproduction writes into existing rows instead of allocating per generation. The spare row
+        # absorbs the unused second child of the last pair when the offspring count is odd.
+        chromosome_length = num_hyperparams + initial_weights.size
+        generation_buffers = [np.empty((population_size + 1, chromosome_length), dtype=population_dtype) for _ in range(2)]
+        parent_buffers = [np.empty((population_size // 2 + 1, chromosome_length), dtype=population_dtype) for _ in range(2)]
+        current_buffer_idx = 0
+        population = generation_buffers[current_buffer_idx][:population_size]
         init_rate_for_spread = initial_mutation_rate if use_dynamic_mutation_rate else mutation_rate # Use initial rate if dynamic for spread
-        for i in range(population_size):
-            # Generate random initial hyperparams
-            hyperparam_values = np.zeros(num_hyperparams, dtype=np.float64)
-            for idx, key in enumerate(hyperparam_keys):
-                 h_config = evolvable_hyperparams_config[key]
-                 h_min, h_max = h_config.get('range', [0.0, 1.0])
-                 hyperparam_values[idx] = random.uniform(h_min, h_max)
-
-            # Generate initial weights (copy or mutated copy)
-            if i == 0: # First individual keeps initial weights
-                 individual_weights = initial_weights.copy()
-            else: # Mutate initial weights for diversity
-                 if mutation_operator == "gaussian":
-                     individual_weights = mutate_weights_gaussian(initial_weights, init_rate_for_spread, mutation_strength, num_hyperparams=0)
-                 elif mutation_operator == "uniform_random":
-                     individual_weights = mutate_weights_uniform_random(initial_weights, init_rate_for_spread, uniform_mutation_range, num_hyperparams=0)
-                 else:
-                     individual_weights = mutate_weights_gaussian(initial_weights, init_rate_for_spread, mutation_strength, num_hyperparams=0)
-
-            chromosome = np.concatenate((hyperparam_values, individual_weights))
-            population.append(chromosome)
+
+        # Random initial hyperparams, uniform within each key's range
+        for idx, key in enumerate(hyperparam_keys):
+             h_config = evolvable_hyperparams_config[key]
+             h_min, h_max = h_config.get('range', [0.0, 1.0])
+             population[:, idx] = rng.uniform(h_min, h_max, size=population_size)
+
+        # Initial weights: first individual keeps them, the rest get a mutated copy for diversity
+        population[:, num_hyperparams:] = initial_weights
+        if mutation_operator == "uniform_random":
+             mutate_weights_uniform_random_batch(population[1:], init_rate_for_spread, uniform_mutation_range, num_hyperparams)
+        else:
+             mutate_weights_gaussian_batch(population[1:], init_rate_for_spread, mutation_strength, num_hyperparams)
 
         if device.type == 'cuda': torch.cuda.empty_cache()
         self.update_state(state='PROGRESS', meta={'progress': 0.01, 'message': 'Initialization complete. Starting generations...', 'fitness_history': [], 'avg_fitness_history': [], 'diversity_history': []})
@@ -282,8 +296,14 @@ def run_evolution_task(self: Task, model_definition_path: str, task_evaluation_p
     avg_fitness_history_overall = []
     diversity_history_overall = []
     # No need for last_fitness_scores, calculate current avg directly
+    pinned_buffers = []
 
     try:
+        # Page-lock the persistent generation buffers once for the run; every generation's uploads DMA straight
+        # from them. Unregistered in the finally block below.
+        if device.type == 'cuda':
+            pinned_buffers = [buf for buf in generation_buffers if pin_numpy_inplace(buf)]
+
         for gen in range(generations):
             gen_num = gen + 1
             logger.info(f"[Task {task_id}] --- Generation {gen_num}/{generations} ---")
@@ -328,7 +348,8 @@ def run_evolution_task(self: Task, model_definition_path: str, task_evaluation_p
                      logger.error(f"[Task {task_id}] Unexpected error checking halt flag: {check_err}. Continuing run.", exc_info=True)
             # --- End Halt Check ---
 
-            # 1. Evaluate Population
+            # 1. Evaluate Population (diversity needs no fitness: compute it on the host pool meanwhile)
+            diversity_future = _HOST_POOL.submit(calculate_population_diversity, population, num_hyperparams)
             try:
                 fitness_scores = evaluate_population_step(
                     population, model_definition_path, model_class, task_eval_func, device,
@@ -351,7 +372,7 @@ def run_evolution_task(self: Task, model_definition_path: str, task_evaluation_p
 
             max_fitness = np.max(valid_scores)
             avg_fitness = np.mean(valid_scores) # Current average fitness
-            diversity = calculate_population_diversity(population, num_hyperparams)
+            diversity = diversity_future.result()
             fitness_history_overall.append(float(max_fitness))
             avg_fitness_history_overall.append(float(avg_fitness))
             diversity_history_overall.append(float(diversity))
@@ -423,85 +444,78 @@ def run_evolution_task(self: Task, model_definition_path: str, task_evaluation_p
             )
 
             # --- 3. SELECTION ---
+            # Selection works on fitness alone and returns row indices into `population` (-inf rows are never picked)
             num_parents_to_select = population_size
-            parents = []
             logger.debug(f"[Task {task_id}] Selecting parents using '{selection_strategy}'...")
-            selectable_indices = [i for i, f in enumerate(fitness_scores) if f > -float('inf')]
-            selectable_population_chromosomes = [population[i] for i in selectable_indices]
-            selectable_fitness = [fitness_scores[i] for i in selectable_indices]
-            # No need to check selectable_indices again, handled by RuntimeError above
 
             if selection_strategy == "tournament":
-                parents = select_parents_tournament(selectable_population_chromosomes, selectable_fitness, num_parents_to_select, tournament_size=tournament_size)
+                parent_indices = select_parent_indices_tournament(fitness_scores, num_parents_to_select, tournament_size=tournament_size)
             elif selection_strategy == "roulette":
-                parents = select_parents_roulette(selectable_population_chromosomes, selectable_fitness, num_parents_to_select)
+                parent_indices = select_parent_indices_roulette(fitness_scores, num_parents_to_select)
             else:
                  logger.warning(f"Unsupported selection strategy '{selection_strategy}', defaulting to tournament.")
-                 parents = select_parents_tournament(selectable_population_chromosomes, selectable_fitness, num_parents_to_select, tournament_size=tournament_size)
-
-            if not parents or len(parents) < 2:
-                logger.warning(f"[Task {task_id}] Parent selection yielded < 2 parents ({len(parents)}). Re-populating from best.")
-                next_population = [best_chromosome_overall.copy()]
-                for _ in range(population_size - 1):
-                    # Mutate based on rate calculated for *this* reproduction step
-                    mutated_best_h = mutate_hyperparams_gaussian(best_chromosome_overall, hyperparam_mutation_strength, num_hyperparams)
-                    mutated_best_w = mutate_weights_gaussian(mutated_best_h, current_mutation_rate, mutation_strength, num_hyperparams)
-                    next_population.append(mutated_best_w)
-                population = next_population[:population_size]
+                 parent_indices = select_parent_indices_tournament(fitness_scores, num_parents_to_select, tournament_size=tournament_size)
+
+            if len(parent_indices) < 2:
+                logger.warning(f"[Task {task_id}] Parent selection yielded < 2 parents ({len(parent_indices)}). Re-populating from best.")
+                current_buffer_idx = 1 - current_buffer_idx
+                next_population = generation_buffers[current_buffer_idx][:population_size]
+                next_population[:] = best_chromosome_overall
+                # Mutate based on rate calculated for *this* reproduction step; row 0 keeps the best unchanged
+                mutate_hyperparams_gaussian_batch(next_population[1:], hyperparam_mutation_strength, num_hyperparams)
+                mutate_weights_gaussian_batch(next_population[1:], current_mutation_rate, mutation_strength, num_hyperparams)
+                population = next_population
                 continue
 
             # --- 4. REPRODUCTION (Elitism + Crossover + Mutation) ---
-            next_population = []
+            next_buffer = generation_buffers[1 - current_buffer_idx]
+            next_population = next_buffer[:population_size]
             logger.debug(f"[Task {task_id}] Reproducing (Elitism={elitism_count}, Cross='{crossover_operator}', Mut(W)='{mutation_operator}')...")
 
             # Elitism
+            num_elites = 0
             if elitism_count > 0:
                  elite_indices = np.argsort(fitness_scores)[::-1][:elitism_count]
-                 for elite_idx in elite_indices:
-                      if len(next_population) < population_size and elite_idx < len(population):
-                           next_population.append(population[elite_idx].copy())
+                 num_elites = len(elite_indices)
+                 next_population[:num_elites] = population[elite_indices]
 
-            # Offspring Generation
-            while len(next_population) < population_size:
+            # Offspring Generation: all pairs crossed and mutated as (num_pairs, L) blocks
+            num_offspring = population_size - num_elites
+            if num_offspring > 0:
+                offspring = next_population[num_elites:]
                 try:
-                    if len(parents) < 2: p1_chrom, p2_chrom = parents[0], parents[0]
-                    else: p1_chrom, p2_chrom = random.sample(parents, 2)
-
-                    # Crossover
-                    child1_chrom, child2_chrom = None, None
-                    if crossover_operator == "one_point": child1_chrom, child2_chrom = crossover_one_point(p1_chrom, p2_chrom, num_hyperparams)
-                    elif crossover_operator == "uniform": child1_chrom, child2_chrom = crossover_uniform(p1_chrom, p2_chrom, num_hyperparams, crossover_prob=uniform_crossover_prob)
-                    elif crossover_operator == "average": child1_chrom, child2_chrom = crossover_average(p1_chrom, p2_chrom, num_hyperparams)
-                    else: child1_chrom, child2_chrom = crossover_one_point(p1_chrom, p2_chrom, num_hyperparams) # Default
+                    num_pairs = (num_offspring + 1) // 2
+                    num_parents = len(parent_indices)
+                    # Two distinct positions in the parent pool per pair, gathered into the reusable parent blocks
+                    first = rng.integers(num_parents, size=num_pairs)
+                    second = (first + rng.integers(1, num_parents, size=num_pairs)) % num_parents
+                    parents_a = np.take(population, parent_indices[first], axis=0, out=parent_buffers[0][:num_pairs], mode='wrap')
+                    parents_b = np.take(population, parent_indices[second], axis=0, out=parent_buffers[1][:num_pairs], mode='wrap')
+
+                    # Crossover: children are written straight into the next generation's rows
+                    out1 = next_buffer[num_elites:num_elites + num_pairs]
+                    out2 = next_buffer[num_elites + num_pairs:num_elites + 2 * num_pairs]
+                    if crossover_operator == "uniform": crossover_uniform_batch(parents_a, parents_b, num_hyperparams, crossover_prob=uniform_crossover_prob, out1=out1, out2=out2)
+                    elif crossover_operator == "average": crossover_average_batch(parents_a, parents_b, num_hyperparams, out1=out1, out2=out2)
+                    else: crossover_one_point_batch(parents_a, parents_b, num_hyperparams, out1=out1, out2=out2) # "one_point" and default
 
                     # Mutation (using rate determined before reproduction)
                     # 1. Mutate Hyperparams
-                    mutated_child1_h = mutate_hyperparams_gaussian(child1_chrom, hyperparam_mutation_strength, num_hyperparams)
-                    mutated_child2_h = mutate_hyperparams_gaussian(child2_chrom, hyperparam_mutation_strength, num_hyperparams)
+                    mutate_hyperparams_gaussian_batch(offspring, hyperparam_mutation_strength, num_hyperparams)
                     # 2. Mutate Weights
-                    mutated_child1_w, mutated_child2_w = None, None
-                    if mutation_operator == "gaussian":
-                        mutated_child1_w = mutate_weights_gaussian(mutated_child1_h, current_mutation_rate, mutation_strength, num_hyperparams)
-                        mutated_child2_w = mutate_weights_gaussian(mutated_child2_h, current_mutation_rate, mutation_strength, num_hyperparams)
-                    elif mutation_operator == "uniform_random":
-                        mutated_child1_w = mutate_weights_uniform_random(mutated_child1_h, current_mutation_rate, uniform_mutation_range, num_hyperparams)
-                        mutated_child2_w = mutate_weights_uniform_random(mutated_child2_h, current_mutation_rate, uniform_mutation_range, num_hyperparams)
-                    else: # Default
-                        mutated_child1_w = mutate_weights_gaussian(mutated_child1_h, current_mutation_rate, mutation_strength, num_hyperparams)
-                        mutated_child2_w = mutate_weights_gaussian(mutated_child2_h, current_mutation_rate, mutation_strength, num_hyperparams)
-
-                    if len(next_population) < population_size: next_population.append(mutated_child1_w)
-                    if len(next_population) < population_size: next_population.append(mutated_child2_w)
+                    if mutation_operator == "uniform_random":
+                        mutate_weights_uniform_random_batch(offspring, current_mutation_rate, uniform_mutation_range, num_hyperparams)
+                    else: # "gaussian" and default
+                        mutate_weights_gaussian_batch(offspring, current_mutation_rate, mutation_strength, num_hyperparams)
 
                 except Exception as repr_err:
-                     logger.warning(f"[Task {task_id}] Reproduction error: {repr_err}. Substituting.", exc_info=True)
-                     if len(next_population) < population_size:
-                          substitute_parent_chrom = random.choice(parents) if parents else best_chromosome_overall
-                          mut_sub_h = mutate_hyperparams_gaussian(substitute_parent_chrom, hyperparam_mutation_strength, num_hyperparams)
-                          mut_sub_w = mutate_weights_gaussian(mut_sub_h, current_mutation_rate, mutation_strength, num_hyperparams) # Use current rate
-                          next_population.append(mut_sub_w)
-
-            population = next_population[:population_size]
+                     logger.warning(f"[Task {task_id}] Reproduction error: {repr_err}. Substituting mutated parents.", exc_info=True)
+                     offspring[:] = population[parent_indices[rng.integers(len(parent_indices), size=num_offspring)]]
+                     mutate_hyperparams_gaussian_batch(offspring, hyperparam_mutation_strength, num_hyperparams)
+                     mutate_weights_gaussian_batch(offspring, current_mutation_rate, mutation_strength, num_hyperparams) # Use current rate
+
+            current_buffer_idx = 1 - current_buffer_idx
+            population = next_population
             gen_time = time.time() - gen_start_time
             logger.info(f"[Task {task_id}] Gen {gen_num} finished in {gen_time:.2f}s")
 
@@ -568,6 +582,8 @@ def run_evolution_task(self: Task, model_definition_path: str, task_evaluation_p
         raise
 
     finally:
+        for buf in pinned_buffers:
+            unpin_numpy(buf)
         # --- NEW: Close Redis connection ---
         if redis_client:
             try: